@@ -26,6 +26,11 @@ import typing
 if typing.TYPE_CHECKING:
     from robot import MyRobot
 
+# Simulated arm travel: position units per second at full motor output, and
+# the position at which the far limit switch trips
+ARM_TRAVEL_RATE = 3
+ARM_TRAVEL_LIMIT = 10
+
 
 class PhysicsEngine:
     """
@@ -98,20 +103,11 @@ class PhysicsEngine:
         self.gyro.setAngle(-pose.rotation().degrees())
 
         # update position (use tm_diff so the rate is constant)
-        self.position += self.motor.getSpeed() * tm_diff * 3
+        self.position += self.motor.getSpeed() * tm_diff * ARM_TRAVEL_RATE
 
         # update limit switches based on position
-        if self.position <= 0:
-            switch1 = True
-            switch2 = False
-
-        elif self.position > 10:
-            switch1 = False
-            switch2 = True
-
-        else:
-            switch1 = False
-            switch2 = False
+        switch1 = self.position <= 0
+        switch2 = self.position > ARM_TRAVEL_LIMIT
 
         # set values here
         self.dio1.setValue(switch1)
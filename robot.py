@@ -33,11 +33,12 @@ class MyRobot(wpilib.TimedRobot):
 
         self.position = wpilib.AnalogInput(2)
 
+        self.timer = wpilib.Timer()
+
     def autonomousInit(self):
         """Called when autonomous mode is enabled"""
 
-        self.timer = wpilib.Timer()
-        self.timer.start()
+        self.timer.restart()
 
     def autonomousPeriodic(self):
         if self.timer.get() < 2.0: